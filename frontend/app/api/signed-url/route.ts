@@ -1,23 +1,48 @@
 import { NextResponse } from 'next/server';
 import { ElevenLabsClient } from 'elevenlabs';
 
+const agentId = process.env.ELEVENLABS_AGENT_ID || process.env.AGENT_ID;
+// Built on first use so a constructor error reaches the handler's catch
+let client: ElevenLabsClient | null = null;
+
+// Signed URLs stay valid for several minutes, so reuse one well inside that window
+const SIGNED_URL_TTL_MS = 60_000;
+
+let cachedSignedUrl: { url: string; fetchedAt: number } | null = null;
+let pendingSignedUrl: Promise<string> | null = null;
+
+async function getSignedUrl(agentId: string): Promise<string> {
+  if (cachedSignedUrl && performance.now() - cachedSignedUrl.fetchedAt < SIGNED_URL_TTL_MS) {
+    return cachedSignedUrl.url;
+  }
+
+  client ??= new ElevenLabsClient();
+
+  // Concurrent requests share a single upstream call
+  pendingSignedUrl ??= client.conversationalAi
+    .getSignedUrl({ agent_id: agentId })
+    .then((response) => {
+      cachedSignedUrl = { url: response.signed_url, fetchedAt: performance.now() };
+      return response.signed_url;
+    })
+    .finally(() => {
+      pendingSignedUrl = null;
+    });
+
+  return pendingSignedUrl;
+}
+
 export async function GET() {
-  const agentId = process.env.ELEVENLABS_AGENT_ID || process.env.AGENT_ID;
   if (!agentId) {
     console.error('ELEVENLABS_AGENT_ID (or AGENT_ID) is not set');
     return NextResponse.json({ error: 'Agent ID is not configured' }, { status: 500 });
   }
 
   try {
-    const client = new ElevenLabsClient();
-    const response = await client.conversationalAi.getSignedUrl({
-      agent_id: agentId,
-    });
-    return NextResponse.json({ signedUrl: response.signed_url });
+    const signedUrl = await getSignedUrl(agentId);
+    return NextResponse.json({ signedUrl });
   } catch (error) {
     console.error('Error getting ElevenLabs signed URL:', error);
     return NextResponse.json({ error: 'Failed to get signed URL' }, { status: 500 });
   }
 }
-
-
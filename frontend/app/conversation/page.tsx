@@ -109,12 +109,16 @@ const ConversationPage = () => {
       setError(null);
 
       await ensureSession();
+      // Fetch the signed URL while the user answers the microphone prompt
+      const signedUrlPromise = getSignedUrl();
+      // Mark as handled; a failure still throws at the await below
+      signedUrlPromise.catch(() => {});
       const hasPermission = await requestMicrophonePermission();
       if (!hasPermission) {
         throw new Error('Microphone permission denied');
       }
 
-      const signedUrl = await getSignedUrl();
+      const signedUrl = await signedUrlPromise;
       await conversation.startSession({ signedUrl });
     } catch (err) {
       console.error(err);
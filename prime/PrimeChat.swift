@@ -125,7 +125,10 @@ final class GeminiChatViewModel: ObservableObject {
     }
     
     func loadUserProfile() async {
-        userFirstName = await SupabaseManager.shared.getCurrentUserFirstName()
+        // Lookups that don't depend on each other run concurrently as child tasks
+        async let firstName = SupabaseManager.shared.getCurrentUserFirstName()
+        async let notesLoaded: Void = fetchUserNotes()
+        async let profile = SupabaseManager.shared.fetchUserProfile()
         
         // Check if this is the first conversation of the day BEFORE creating the new one
         await checkIfFirstChatOfDay()
@@ -133,11 +136,11 @@ final class GeminiChatViewModel: ObservableObject {
         // Create a new conversation in Supabase
         await createConversation()
         
-        // Fetch existing notes about the user
-        await fetchUserNotes()
+        userFirstName = await firstName
+        await notesLoaded
         
         do {
-            userProfile = try await SupabaseManager.shared.fetchUserProfile()
+            userProfile = try await profile
             print("✅ Loaded user profile for chat")
             
             // Send initial greeting after loading profile
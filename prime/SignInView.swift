@@ -156,6 +156,11 @@ struct SignInView: View {
 
   // MARK: - Crypto Helpers
 
+  private static let nonceCharset: [UInt8] =
+    Array("0123456789ABCDEFGHIJKLMNOPQRSTUVXYZabcdefghijklmnopqrstuvwxyz-._".utf8)
+
+  private static let hexDigits: [UInt8] = Array("0123456789abcdef".utf8)
+
   private func randomNonceString(length: Int = 32) -> String {
     precondition(length > 0)
     var randomBytes = [UInt8](repeating: 0, count: length)
@@ -164,25 +169,27 @@ struct SignInView: View {
       fatalError("Unable to generate nonce. SecRandomCopyBytes failed with OSStatus \(errorCode)")
     }
 
-    let charset: [Character] =
-      Array("0123456789ABCDEFGHIJKLMNOPQRSTUVXYZabcdefghijklmnopqrstuvwxyz-._")
-
+    let charset = Self.nonceCharset
     let nonce = randomBytes.map { byte in
       // Pick a random character from the set, wrapping around if needed.
       charset[Int(byte) % charset.count]
     }
 
-    return String(nonce)
+    return String(decoding: nonce, as: UTF8.self)
   }
 
   private func sha256(_ input: String) -> String {
-    let inputData = Data(input.utf8)
-    let hashedData = SHA256.hash(data: inputData)
-    let hashString = hashedData.compactMap {
-      String(format: "%02x", $0)
-    }.joined()
+    let hashedData = SHA256.hash(data: Data(input.utf8))
+
+    // Encode straight into ASCII bytes instead of formatting one String per byte
+    var hex = [UInt8]()
+    hex.reserveCapacity(SHA256.byteCount * 2)
+    for byte in hashedData {
+      hex.append(Self.hexDigits[Int(byte >> 4)])
+      hex.append(Self.hexDigits[Int(byte & 0x0f)])
+    }
 
-    return hashString
+    return String(decoding: hex, as: UTF8.self)
   }
 }
 
@@ -17,6 +17,17 @@ class SupabaseManager: ObservableObject {
 
   private let client: SupabaseClient
 
+  /// Resolved user ID, reused briefly so each query doesn't re-read the session
+  private var cachedUserId: (id: UUID, validUntil: ContinuousClock.Instant)?
+  private let userIdCacheTTL: Duration = .seconds(5)
+
+  /// Cached profile for the signed-in user; several screens fetch it on appear
+  private var cachedProfile: (profile: UserProfile, validUntil: ContinuousClock.Instant)?
+  private let profileCacheTTL: Duration = .seconds(60)
+
+  /// Bumped on every auth change; lookups that started earlier must not write to the caches
+  private var authGeneration = 0
+
   private init() {
     print("🚀 [SupabaseManager] Initializing Supabase client...")
     
@@ -90,6 +101,7 @@ class SupabaseManager: ObservableObject {
     lastCompletedStep: String? = nil
   ) async throws -> UserProfile {
     // Get the current authenticated user ID
+    let generation = authGeneration
     let userId = try await getCurrentUserId()
 
     // Map enum values to database-friendly strings
@@ -126,6 +138,7 @@ class SupabaseManager: ObservableObject {
         .execute()
 
       print("✅ Supabase response received - profile saved/updated")
+      cacheProfile(response.value, generation: generation)
       return response.value
     } catch {
       print("❌ Supabase error during profile save:")
@@ -137,8 +150,13 @@ class SupabaseManager: ObservableObject {
 
   /// Fetch the current user's profile
   func fetchUserProfile() async throws -> UserProfile? {
+    let generation = authGeneration
     let userId = try await getCurrentUserId()
 
+    if let cached = cachedProfile, cached.profile.userId == userId, cached.validUntil > ContinuousClock.now {
+      return cached.profile
+    }
+
     // Use limit(1) instead of single() to avoid throwing error when no profile exists
     let response: PostgrestResponse<[UserProfile]> =
       try await client
@@ -148,8 +166,17 @@ class SupabaseManager: ObservableObject {
       .limit(1)
       .execute()
 
+    // Only cache real profiles so a fresh account still sees its first save
+    if let profile = response.value.first {
+      cacheProfile(profile, generation: generation)
+    }
     return response.value.first
   }
+
+  /// Drop the cached profile so the next fetch goes to the database
+  func invalidateUserProfileCache() {
+    cachedProfile = nil
+  }
   
   /// Update the user's coaching style preference
   func updateCoachingStyle(_ style: CoachingStyle) async throws {
@@ -167,6 +194,7 @@ class SupabaseManager: ObservableObject {
       .update(update)
       .eq("user_id", value: userId.uuidString)
       .execute()
+    invalidateUserProfileCache()
     
     print("✅ Updated coaching style to: \(style.rawValue)")
   }
@@ -342,14 +370,15 @@ class SupabaseManager: ObservableObject {
     formatter.formatOptions = [.withInternetDateTime, .withFractionalSeconds]
     let startOfTodayString = formatter.string(from: startOfToday)
     
-    let response: PostgrestResponse<[ChatConversation]> = try await client
+    // HEAD request with an exact count: no rows are sent back or decoded
+    let response = try await client
       .from("chat_conversations")
-      .select()
+      .select("id", head: true, count: .exact)
       .eq("user_id", value: userId.uuidString)
       .gte("created_at", value: startOfTodayString)
       .execute()
     
-    return response.value.count
+    return response.count ?? 0
   }
 
   /// Fetch messages for a specific conversation
@@ -551,21 +580,26 @@ class SupabaseManager: ObservableObject {
 
   /// Sign up a new user with email and password
   func signUp(email: String, password: String) async throws {
+    defer { clearAuthCaches() }
     try await client.auth.signUp(email: email, password: password)
   }
 
   /// Sign in an existing user
   func signIn(email: String, password: String) async throws {
+    defer { clearAuthCaches() }
     try await client.auth.signIn(email: email, password: password)
   }
 
   /// Sign in with Apple ID token
   func signInWithApple(idToken: String, nonce: String) async throws {
+    defer { clearAuthCaches() }
     try await client.auth.signInWithIdToken(credentials: .init(provider: .apple, idToken: idToken, nonce: nonce))
   }
 
   /// Sign out the current user
   func signOut() async throws {
+    // Clear once the call returns so a lookup made mid-sign-out can't re-cache the old user
+    defer { clearAuthCaches() }
     do {
       try await client.auth.signOut()
       print("✅ Supabase sign out successful")
@@ -581,6 +615,8 @@ class SupabaseManager: ObservableObject {
     let userId = try await getCurrentUserId()
     
     print("🗑️ Deleting account for user: \(userId)")
+    // Clear after the RPC and local sign-out so a fetch made meanwhile can't re-cache this account
+    defer { clearAuthCaches() }
     
     // Call the database function that handles all deletions including auth.users
     // This function runs with SECURITY DEFINER privileges
@@ -598,15 +634,22 @@ class SupabaseManager: ObservableObject {
 
   /// Force clear all session data (debug only)
   func forceClearSession() {
+    clearAuthCaches()
     // Clear Supabase client session
     Task {
       try? await client.auth.signOut(scope: .local)
+      clearAuthCaches()
     }
     print("🔄 Force cleared local session")
   }
 
   /// Get the current authenticated user's ID
   func getCurrentUserId() async throws -> UUID {
+    if let cached = cachedUserId, cached.validUntil > ContinuousClock.now {
+      return cached.id
+    }
+
+    let generation = authGeneration
     do {
       let session = try await client.auth.session
       print("🔐 Current session:")
@@ -622,6 +665,12 @@ class SupabaseManager: ObservableObject {
         print("❌ Could not parse user ID: \(session.user.id.uuidString)")
         throw SupabaseError.authenticationRequired
       }
+
+      // Never trust the cached ID past the token's own expiry, or after auth changed mid-lookup
+      if generation == authGeneration {
+        let tokenRemaining = Duration.seconds(session.expiresAt - Date().timeIntervalSince1970)
+        cachedUserId = (userId, ContinuousClock.now + min(userIdCacheTTL, tokenRemaining))
+      }
       return userId
     } catch {
       print("❌ Failed to get current user: \(error)")
@@ -720,6 +769,17 @@ class SupabaseManager: ObservableObject {
 
   // MARK: - Helper Methods
 
+  private func cacheProfile(_ profile: UserProfile, generation: Int) {
+    guard generation == authGeneration else { return }
+    cachedProfile = (profile, ContinuousClock.now + profileCacheTTL)
+  }
+
+  private func clearAuthCaches() {
+    authGeneration += 1
+    cachedUserId = nil
+    cachedProfile = nil
+  }
+
   private func mapGoalRecencyToDatabase(_ recency: GoalRecency?) -> String? {
     switch recency {
     case .lastWeek: